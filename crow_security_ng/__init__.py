@@ -1,13 +1,32 @@
-from .client import CrowSecurityClient
+from .client import CrowSecurityClient, close_shared_session, get_shared_session
 from .exceptions import (
+    AuthenticationError,
+    CrowError,
     CrowSecurityError,
     CrowSecurityAuthenticationError,
     CrowSecurityConnectionError,
+    InvalidMacError,
+    PanelNotFoundError,
+    RateLimitError,
+    ResponseError,
 )
 
+# Importable by name, but left out of __all__ so that a star import does not
+# shadow the builtins of the same name
+from .exceptions import ConnectionError as ConnectionError
+from .exceptions import TimeoutError as TimeoutError
+
 __all__ = [
     "CrowSecurityClient",
+    "get_shared_session",
+    "close_shared_session",
     "CrowSecurityError",
     "CrowSecurityAuthenticationError",
     "CrowSecurityConnectionError",
+    "CrowError",
+    "AuthenticationError",
+    "ResponseError",
+    "PanelNotFoundError",
+    "RateLimitError",
+    "InvalidMacError",
 ]
\ No newline at end of file
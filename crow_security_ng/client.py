@@ -1,29 +1,207 @@
-import logging
-import aiohttp
 import asyncio
+import base64
 import json
+import logging
+import random
 import re
+import time
+from collections import OrderedDict
+
+import aiohttp
 
 from .exceptions import (
-    CrowSecurityError,
     CrowSecurityAuthenticationError,
     CrowSecurityConnectionError,
+    CrowSecurityError,
 )
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # Optional speedup, see the "fast" extra
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
 _LOGGER = logging.getLogger(__name__)
 
+_MAC_SEPARATORS = str.maketrans("", "", ":-. _")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_MAC_NON_HEX = re.compile(r"[^a-fA-F0-9]")
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
 BASE_URL = "https://api.crowcloud.xyz"
 
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRY_COUNT = 3
+DEFAULT_RETRY_DELAY = 1.0
+DEFAULT_MAX_DELAY = 60.0
+
+# Number of GET responses kept for ETag revalidation, per client
+RESPONSE_CACHE_SIZE = 64
+
+# Used when the token carries no expiry we can read
+DEFAULT_TOKEN_LIFETIME = 3600
+# A token is stale (refreshed in the background) once less than this
+# fraction of its lifetime is left, and expired (refreshed inline) at zero.
+TOKEN_STALE_FRACTION = 0.05
+
+# Connection pool defaults. The keepalive matches nginx's 75s default so idle
+# sockets survive between polls instead of being dropped after aiohttp's 15s.
+CONNECTOR_LIMIT = 32
+CONNECTOR_LIMIT_PER_HOST = 16
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+
+
+
+class _SharedSession:
+    """A session shared by the clients running on one event loop."""
+
+    __slots__ = ("session", "loop", "owned", "pinned", "users")
+
+    def __init__(self, session, loop, owned, pinned):
+        self.session = session
+        self.loop = loop
+        self.owned = owned  # Created here, so ours to close
+        self.pinned = pinned  # Lives until close_shared_session()
+        self.users = 0  # Clients currently subscribed
+
+
+# One session per event loop so the TCP/TLS connection pool is reused across
+# clients instead of each client paying its own handshakes. Keyed by loop,
+# since an aiohttp session cannot be used from any other loop.
+_SHARED_SESSIONS = {}
+
+
+def create_connector(
+    limit=CONNECTOR_LIMIT,
+    limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+    keepalive_timeout=KEEPALIVE_TIMEOUT,
+    ttl_dns_cache=DNS_CACHE_TTL,
+):
+    """Create a TCP connector tuned for periodic polling of the Crow Cloud API."""
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=ttl_dns_cache,
+    )
+
+
+def _shared_entry():
+    """Get or create the shared session entry for the running loop."""
+    loop = asyncio.get_running_loop()
+    entry = _SHARED_SESSIONS.get(loop)
+    if entry is None or entry.session.closed:
+        # Forget sessions left behind by loops that have since been closed
+        for stale in [lp for lp in _SHARED_SESSIONS if lp.is_closed()]:
+            del _SHARED_SESSIONS[stale]
+        session = aiohttp.ClientSession(
+            connector=create_connector(),
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+        )
+        entry = _SHARED_SESSIONS[loop] = _SharedSession(session, loop, owned=True, pinned=False)
+    return entry
+
+
+async def _release_shared_entry(entry):
+    """Drop a client's subscription, closing an unpinned session nobody uses."""
+    entry.users -= 1
+    if entry.users > 0 or entry.pinned or not entry.owned:
+        return
+    if _SHARED_SESSIONS.get(entry.loop) is entry:
+        del _SHARED_SESSIONS[entry.loop]
+        await entry.session.close()
+
+
+def get_shared_session():
+    """
+    Get or create the aiohttp session shared by all clients on the running loop.
+
+    A session fetched here stays open after its clients close; call
+    close_shared_session() when the application shuts down.
+    """
+    entry = _shared_entry()
+    entry.pinned = True
+    return entry.session
+
+
+async def close_shared_session():
+    """
+    Close the shared session of the running loop.
+
+    A session injected with configure_shared_session() is only forgotten,
+    never closed, since its owner manages it.
+    """
+    entry = _SHARED_SESSIONS.pop(asyncio.get_running_loop(), None)
+    if entry is not None and entry.owned:
+        await entry.session.close()
+
+
 class CrowSecurityClient:
-    def __init__(self, username, password, mac_address, session=None):
-        """Initialize the Crow Security Client."""
+    # Statuses worth retrying with backoff; everything else >= 400 is raised.
+    _STATUS_RETRY = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        username,
+        password,
+        mac_address,
+        session=None,
+        retry_count=DEFAULT_RETRY_COUNT,
+        retry_delay=DEFAULT_RETRY_DELAY,
+        max_delay=DEFAULT_MAX_DELAY,
+        api_base=BASE_URL,
+    ):
+        """
+        Initialize the Crow Security Client.
+
+        If no session is given, the client subscribes to the shared session
+        of its event loop, which is closed once its last client closes (unless
+        the application configured or fetched it). A caller-provided session
+        is never closed by the client.
+        """
         self._username = username
         self._password = password
         self._mac = self._format_mac(mac_address)
         self._session = session
+        self._owns_session = session is None
+        self._shared = None  # _SharedSession subscribed to, if we own the session
+        self._retry_count = retry_count
+        self._retry_delay = retry_delay
+        self._max_delay = max_delay
+        # Endpoint URLs are built once here rather than on every call
+        api_base = api_base.rstrip("/")
+        self._url_login = f"{api_base}/v1/login"
+        self._url_systems = f"{api_base}/v1/systems"  # or /v1/panels
         self._token = None
+        self._token_expiry = 0.0  # time.monotonic() deadline
+        self._token_lifetime = DEFAULT_TOKEN_LIFETIME
+        self._refresh_task = None
+        self._refresh_ok = True
+        # Serializes logins so concurrent callers share one login request
+        self._auth_lock = asyncio.Lock()
+        self._headers = None  # Rebuilt only when the token changes
+        # (url, params) -> (ETag, raw body) of recent GETs, oldest first
+        self._response_cache = OrderedDict()
         self._panel_id = None  # Sometimes returned by login, useful for subsequent calls
 
+        # Payload structure
+        # We send the formatted MAC address. Some APIs call this 'central_id', 'mac', or 'panel_id'.
+        # I am sending it as 'mac' and 'central_id' to cover bases, or strictly as 'mac' if documented.
+        # Credentials don't change for the lifetime of the client, so the body is encoded once.
+        self._login_body = _dumps({
+            "username": self._username,
+            "password": self._password,
+            "mac": self._mac, 
+            "type": "crow_security_ng" # Sometimes required to identify the client type
+        })
+
     def _format_mac(self, mac: str) -> str:
         """
         Strip colons, dashes, and spaces, and convert to uppercase.
@@ -31,14 +209,73 @@ class CrowSecurityClient:
         """
         if not mac:
             return ""
-        clean_mac = re.sub(r"[^a-fA-F0-9]", "", mac)
+        clean_mac = mac.translate(_MAC_SEPARATORS)
+        if not _HEX_DIGITS.issuperset(clean_mac):
+            # Unusual input; fall back to dropping every non-hex character
+            clean_mac = _MAC_NON_HEX.sub("", clean_mac)
         return clean_mac.upper()
 
-    async def _get_session(self):
-        """Get or create the aiohttp session."""
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
-        return self._session
+    def _get_headers(self):
+        """Get the request headers, reusing the cached dict while the token is unchanged."""
+        return self._headers or self._rebuild_headers()
+
+    def _rebuild_headers(self):
+        """Build the request headers for the current token."""
+        self._headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Accept": "application/json"
+        }
+        return self._headers
+
+    @staticmethod
+    def configure_shared_session(session=None, connector=None, timeout=DEFAULT_TIMEOUT, **connector_kwargs):
+        """
+        Set the session shared by clients on the running loop that have no session of their own.
+
+        Hosts such as Home Assistant can pass their own session, which is then
+        never closed here, or a connector from which a new shared session is
+        built. Without either, a connector is created from connector_kwargs
+        (limit, limit_per_host, keepalive_timeout, ttl_dns_cache).
+
+        Must be called from the event loop the clients run on.
+
+        Raises:
+            RuntimeError: If the loop already has an open shared session;
+                close it with close_shared_session() first.
+        """
+        loop = asyncio.get_running_loop()
+        entry = _SHARED_SESSIONS.get(loop)
+        if entry is not None and not entry.session.closed:
+            raise RuntimeError(
+                "A shared session is already in use; call close_shared_session() first"
+            )
+        owned = session is None
+        if owned:
+            if connector is None:
+                connector = create_connector(**connector_kwargs)
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            )
+        _SHARED_SESSIONS[loop] = _SharedSession(session, loop, owned=owned, pinned=True)
+
+    def _get_session(self):
+        """
+        Get the caller-provided session, or the shared one of the running loop.
+
+        Synchronous, since nothing here awaits; this avoids creating a
+        coroutine on every request.
+        """
+        if not self._owns_session:
+            return self._session
+        shared = self._shared
+        if shared is None or _SHARED_SESSIONS.get(asyncio.get_running_loop()) is not shared:
+            # First use, a new event loop, or the shared session was replaced
+            if shared is not None:
+                shared.users -= 1
+            shared = self._shared = _shared_entry()
+            shared.users += 1
+        return shared.session
 
     async def login(self):
         """
@@ -48,35 +285,25 @@ class CrowSecurityClient:
         POST /auth/login (or similar endpoint)
         Payload usually requires username, password, and the system ID (MAC).
         """
-        session = await self._get_session()
+        session = self._get_session()
         
         # Endpoint: Based on standard Crow API structure. 
         # If this 404s, the endpoint might be /v1/user/login or /api/auth/login
-        url = f"{BASE_URL}/v1/login" 
-
-        # Payload structure
-        # We send the formatted MAC address. Some APIs call this 'central_id', 'mac', or 'panel_id'.
-        # I am sending it as 'mac' and 'central_id' to cover bases, or strictly as 'mac' if documented.
-        payload = {
-            "username": self._username,
-            "password": self._password,
-            "mac": self._mac, 
-            "type": "crow_security_ng" # Sometimes required to identify the client type
-        }
+        url = self._url_login
 
         _LOGGER.debug(f"Attempting login to {url} with MAC: {self._mac}")
 
         try:
-            async with session.post(url, json=payload) as response:
+            async with session.post(url, data=self._login_body, headers=_JSON_CONTENT_TYPE) as response:
                 _LOGGER.debug(f"Login Response Status: {response.status}")
                 
                 if response.status in (401, 403):
-                    data = await response.json()
+                    data = await response.json(loads=_loads)
                     _LOGGER.error(f"Authentication failed: {data}")
                     raise CrowSecurityAuthenticationError("Invalid credentials or MAC address")
                 
                 response.raise_for_status()
-                data = await response.json()
+                data = await response.json(loads=_loads)
                 
                 # Parse Token
                 # Adjust 'access_token' key based on actual API response
@@ -87,6 +314,10 @@ class CrowSecurityClient:
                 else:
                     _LOGGER.error(f"No token found in response: {data}")
                     raise CrowSecurityAuthenticationError("API did not return an access token")
+                self._rebuild_headers()
+                self._token_lifetime = self._token_lifetime_from(data)
+                self._token_expiry = time.monotonic() + self._token_lifetime
+                self._refresh_ok = True
 
                 # Parse Panel ID if available
                 self._panel_id = data.get("panel_id", data.get("id"))
@@ -95,41 +326,193 @@ class CrowSecurityClient:
                 return True
 
         except aiohttp.ClientError as e:
-            raise CrowSecurityConnectionError(f"Connection error: {e}")
+            raise CrowSecurityConnectionError(f"Connection error: {e}") from e
         except Exception as e:
-            raise CrowSecurityError(f"Unexpected error during login: {e}")
+            raise CrowSecurityError(f"Unexpected error during login: {e}") from e
 
-    async def get_systems(self):
-        """Get list of systems/panels associated with the account."""
+    def _token_lifetime_from(self, data):
+        """
+        Work out how long the current token is valid, in seconds.
+
+        Uses the JWT 'exp' claim if the token is a JWT, then an 'expires_in'
+        field in the login response, then DEFAULT_TOKEN_LIFETIME.
+        """
+        try:
+            payload = self._token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            lifetime = float(claims["exp"]) - time.time()
+        except (IndexError, KeyError, TypeError, ValueError):
+            lifetime = data.get("expires_in", DEFAULT_TOKEN_LIFETIME)
+        try:
+            lifetime = float(lifetime)
+        except (TypeError, ValueError):
+            lifetime = DEFAULT_TOKEN_LIFETIME
+        return lifetime if lifetime > 0 else DEFAULT_TOKEN_LIFETIME
+
+    def _token_remaining(self):
+        """Seconds until the current token expires (negative if expired or missing)."""
         if not self._token:
-            await self.login()
+            return -1.0
+        return self._token_expiry - time.monotonic()
 
-        url = f"{BASE_URL}/v1/systems" # or /v1/panels
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Accept": "application/json"
-        }
+    def _token_is_fresh(self):
+        """Check if the token has more than the stale window left."""
+        return self._token_remaining() > self._token_lifetime * TOKEN_STALE_FRACTION
+
+    async def _ensure_authenticated(self):
+        """
+        Make sure a usable token is available.
 
-        session = await self._get_session()
+        A fresh token is used as is. A stale token is still used, while a
+        refresh runs in the background. An expired or missing token, or a
+        stale one whose last background refresh failed, blocks on login().
+        Concurrent callers wait for the same login instead of each sending one.
+        """
+        if self._token_is_fresh():
+            return
+        if self._token_remaining() > 0 and self._refresh_ok:
+            if self._refresh_task is None:
+                self._refresh_task = asyncio.create_task(self._refresh_in_background())
+            return
+        async with self._auth_lock:
+            # Another caller may have logged in while we waited
+            if not self._token_is_fresh():
+                await self.login()
+
+    async def _refresh_in_background(self):
+        """Refresh a stale token without holding up the caller."""
         try:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 401:
-                    # Token might be expired, retry once
+            async with self._auth_lock:
+                if not self._token_is_fresh():
                     await self.login()
-                    headers["Authorization"] = f"Bearer {self._token}"
-                    async with session.get(url, headers=headers) as retry_response:
-                        retry_response.raise_for_status()
-                        return await retry_response.json()
-                
-                response.raise_for_status()
-                return await response.json()
+        except CrowSecurityError as e:
+            _LOGGER.warning(f"Background token refresh failed: {e}")
+            self._refresh_ok = False
+        finally:
+            self._refresh_task = None
+
+    def _backoff_delay(self, attempt):
+        """Exponential backoff with jitter, so retries across panels don't line up."""
+        delay = min(self._retry_delay * (2 ** attempt), self._max_delay)
+        return delay * random.uniform(0.5, 1.5)
+
+    @staticmethod
+    def _cache_key(method, url, kwargs):
+        """Get the response cache key of a request, or None if it is not cacheable."""
+        if method != "GET" or not kwargs.keys() <= {"params"}:
+            return None
+        params = kwargs.get("params")
+        if isinstance(params, dict):
+            params = tuple(sorted(params.items()))
+        key = (url, params)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _cache_response(self, key, etag, raw):
+        """Remember a GET response for revalidation, evicting the oldest."""
+        cache = self._response_cache
+        cache[key] = (etag, raw)
+        cache.move_to_end(key)
+        if len(cache) > RESPONSE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    async def _request(self, method, url, **kwargs):
+        """
+        Make an authenticated request and return the decoded JSON body.
+
+        Connection errors, 429 and transient 5xx responses are retried with
+        jittered exponential backoff; a Retry-After header takes precedence.
+        A 401 triggers one re-login.
+
+        Recent GET responses that carry an ETag are cached per URL and params.
+        Later GETs send If-None-Match, and a 304 is answered from the cached
+        body. This only saves the transfer: every call still decodes its own
+        copy, so callers may mutate the result.
+        """
+        await self._ensure_authenticated()
+
+        session = self._get_session()
+        cache_key = self._cache_key(method, url, kwargs)
+        reauthenticated = False
+        attempt = 0
+        while True:
+            retry_after = None
+            headers = base_headers = self._get_headers()
+            cached = self._response_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                headers = {**base_headers, "If-None-Match": cached[0]}
+            try:
+                async with session.request(method, url, headers=headers, **kwargs) as response:
+                    status = response.status
+                    # Success is by far the common case, so it is checked first
+                    if status < 400:
+                        if status == 304 and cached is not None:
+                            self._response_cache.move_to_end(cache_key)
+                            raw = cached[1]
+                        else:
+                            raw = await response.read()
+                            etag = response.headers.get("ETag")
+                            if etag and cache_key is not None and status != 304:
+                                self._cache_response(cache_key, etag, raw)
+                        # Decode the raw bytes directly; response.json() would
+                        # first build an intermediate str of the whole body.
+                        return _loads(raw) if raw else None
+
+                    if status == 401 and not reauthenticated:
+                        # Token might be expired, retry once. Only drop it if no
+                        # concurrent request has already replaced it.
+                        if self._headers is base_headers:
+                            self._token = None
+                            self._headers = None
+                        await self._ensure_authenticated()
+                        reauthenticated = True
+                        continue
+
+                    if status not in self._STATUS_RETRY or attempt >= self._retry_count:
+                        response.raise_for_status()
+
+                    header = response.headers.get("Retry-After")
+                    if header and header.isdigit():
+                        retry_after = min(float(header), self._max_delay)
+                    _LOGGER.debug(f"Request to {url} returned {status}, retrying")
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self._retry_count:
+                    raise CrowSecurityConnectionError(f"Connection error: {e}") from e
+                _LOGGER.debug(f"Request to {url} failed ({e}), retrying")
+
+            await asyncio.sleep(retry_after if retry_after is not None else self._backoff_delay(attempt))
+            attempt += 1
+
+    async def get_systems(self):
+        """Get list of systems/panels associated with the account."""
+        try:
+            return await self._request("GET", self._url_systems)
+        except CrowSecurityError:
+            raise
         except Exception as e:
-            raise CrowSecurityError(f"Failed to fetch systems: {e}")
+            raise CrowSecurityError(f"Failed to fetch systems: {e}") from e
 
     async def close(self):
-        """Close the session."""
-        if self._session:
-            await self._session.close()
+        """
+        Release the client.
+
+        A caller-provided session is left open. The shared session is closed
+        when this was its last client, unless the application configured or
+        fetched it, in which case close_shared_session() closes it.
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        self._token = None
+        self._headers = None
+        self._response_cache.clear()
+        shared, self._shared = self._shared, None
+        if shared is not None:
+            await _release_shared_entry(shared)
 
     async def __aenter__(self):
         return self
@@ -1,11 +1,118 @@
-class CrowSecurityError(Exception):
+"""Exceptions for the Crow Security NG library.
+
+Exceptions declare __slots__ so their attributes live in slots rather than
+in a per-instance __dict__, which keeps retry-heavy error paths cheap.
+"""
+from __future__ import annotations
+
+
+class CrowError(Exception):
+    """Base exception for Crow Security NG."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str = "An error occurred communicating with Crow Cloud") -> None:
+        super().__init__(message)
+        self.message = message
+
+
+class AuthenticationError(CrowError):
+    """Raised when authentication fails."""
+
+    __slots__ = ()
+
+    def __init__(self, message: str = "Authentication with Crow Cloud failed") -> None:
+        super().__init__(message)
+
+
+class ConnectionError(CrowError):
+    """Raised when the Crow Cloud API cannot be reached."""
+
+    __slots__ = ()
+
+    def __init__(self, message: str = "Could not connect to Crow Cloud") -> None:
+        super().__init__(message)
+
+
+class TimeoutError(CrowError):
+    """Raised when a request to the Crow Cloud API times out."""
+
+    __slots__ = ()
+
+    def __init__(self, message: str = "Request to Crow Cloud timed out") -> None:
+        super().__init__(message)
+
+
+class ResponseError(CrowError):
+    """Raised when the API returns an unexpected status code."""
+
+    __slots__ = ("status_code", "response_text")
+
+    def __init__(
+        self,
+        status_code: int,
+        message: str | None = None,
+        response_text: str | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.response_text = response_text
+        text = f"API request failed with status {status_code}"
+        if message:
+            text = f"{text}: {message}"
+        if response_text:
+            # Keep the error readable when the server returns a whole page
+            text = f"{text} - {response_text[:200]}"
+        super().__init__(text)
+
+
+class PanelNotFoundError(CrowError):
+    """Raised when a panel cannot be found."""
+
+    __slots__ = ("mac",)
+
+    def __init__(self, mac: str) -> None:
+        self.mac = mac
+        super().__init__(f"Panel with MAC address {mac} not found")
+
+
+class RateLimitError(CrowError):
+    """Raised when the API rate limit is exceeded."""
+
+    __slots__ = ("retry_after",)
+
+    def __init__(self, retry_after: int | None = None) -> None:
+        self.retry_after = retry_after
+        message = "API rate limit exceeded"
+        if retry_after is not None:
+            message = f"{message}, retry after {retry_after} seconds"
+        super().__init__(message)
+
+
+class InvalidMacError(CrowError):
+    """Raised when a MAC address is invalid."""
+
+    __slots__ = ("mac",)
+
+    def __init__(self, mac: str) -> None:
+        self.mac = mac
+        super().__init__(
+            f"Invalid MAC address: {mac!r}. Expected 12 hexadecimal characters"
+        )
+
+
+class CrowSecurityError(CrowError):
     """Base exception for Crow Security."""
-    pass
+
+    __slots__ = ()
+
 
 class CrowSecurityAuthenticationError(CrowSecurityError):
     """Raised when authentication fails."""
-    pass
+
+    __slots__ = ()
+
 
 class CrowSecurityConnectionError(CrowSecurityError):
     """Raised when connection issues occur."""
-    pass
\ No newline at end of file
+
+    __slots__ = ()
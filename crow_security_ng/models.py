@@ -1,11 +1,43 @@
 """Data models for the Crow Security NG library."""
 from __future__ import annotations
 
+import os
+import sys
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
+# Device models (zones, areas, outputs, measurements, events) only keep the
+# raw API dict when CROW_KEEP_RAW=1; otherwise they share one empty read-only
+# mapping so polled lists don't pin every response in memory.
+_KEEP_RAW = os.environ.get("CROW_KEEP_RAW", "0") == "1"
+_EMPTY_RAW: Mapping[str, Any] = MappingProxyType({})
+# Response envelope keys that are shared across sibling models and not worth
+# retaining on each one
+_STRIP_KEYS = frozenset({"_meta", "_links", "_translations", "etag"})
+
+
+def _raw(data: dict[str, Any]) -> Mapping[str, Any]:
+    """Get the raw_data to store on a device model."""
+    if not _KEEP_RAW:
+        return _EMPTY_RAW
+    if _STRIP_KEYS.isdisjoint(data):
+        return data
+    return {key: value for key, value in data.items() if key not in _STRIP_KEYS}
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern categorical strings such as states, types and units.
+    
+    They come from a tiny vocabulary repeated across every zone, so interning
+    lets all models share one string object per value.
+    """
+    return sys.intern(value) if type(value) is str else value
+
 
 class AreaState(str, Enum):
     """Alarm area states."""
@@ -20,11 +52,13 @@ class AreaState(str, Enum):
     @classmethod
     def from_api(cls, value: str) -> "AreaState":
         """Convert API state string to enum."""
-        value_lower = value.lower() if value else ""
-        for state in cls:
-            if state.value == value_lower:
-                return state
-        return cls.DISARMED
+        if not value:
+            return cls.DISARMED
+        return _AREA_STATES.get(value.lower(), cls.DISARMED)
+
+
+# Lookup table for AreaState.from_api, built once instead of scanning members
+_AREA_STATES: dict[str, AreaState] = {state.value: state for state in AreaState}
 
 
 class AreaCommand(str, Enum):
@@ -45,7 +79,13 @@ class ZoneState(str, Enum):
     LOW_BATTERY = "low_battery"
 
 
-@dataclass
+# Raw zone states that mean the zone is open/triggered
+_OPEN_STATES = frozenset({"open", "alarm", "triggered", "violated", "1", "active"})
+_ARMED_STATES = frozenset({AreaState.ARMED, AreaState.STAY_ARMED})
+_ARMING_STATES = frozenset({AreaState.ARM_IN_PROGRESS, AreaState.STAY_ARM_IN_PROGRESS})
+
+
+@dataclass(slots=True)
 class Zone:
     """Represents an alarm zone/sensor."""
     
@@ -57,7 +97,14 @@ class Zone:
     battery: int | None = None
     signal_strength: int | None = None
     tamper: bool = False
-    raw_data: dict[str, Any] = field(default_factory=dict)
+    raw_data: Mapping[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_api_many(cls, items: Iterable[dict[str, Any]]) -> list["Zone"]:
+        """Create Zone objects from a list of API response items."""
+        # Bound once so the comprehension doesn't repeat the attribute lookup
+        from_api = cls.from_api
+        return [from_api(item) for item in items]
     
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Zone":
@@ -66,19 +113,19 @@ class Zone:
         return cls(
             id=str(zone_id),
             name=data.get("name", f"Zone {zone_id}"),
-            state=data.get("state", data.get("status", "ok")),
-            zone_type=data.get("type", data.get("zone_type", "generic")),
+            state=_intern(data.get("state", data.get("status", "ok"))),
+            zone_type=_intern(data.get("type", data.get("zone_type", "generic"))),
             bypassed=data.get("bypassed", data.get("bypass", False)),
             battery=data.get("battery", data.get("batteryLevel")),
             signal_strength=data.get("signal", data.get("rssi")),
             tamper=data.get("tamper", False),
-            raw_data=data,
+            raw_data=_raw(data),
         )
     
     @property
     def is_open(self) -> bool:
         """Check if zone is open/triggered."""
-        return self.state.lower() in ("open", "alarm", "triggered", "violated", "1", "active")
+        return self.state.lower() in _OPEN_STATES
     
     @property
     def has_low_battery(self) -> bool:
@@ -88,14 +135,20 @@ class Zone:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class Area:
     """Represents an alarm area/partition."""
     
     id: str
     name: str
     state: AreaState = AreaState.DISARMED
-    raw_data: dict[str, Any] = field(default_factory=dict)
+    raw_data: Mapping[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_api_many(cls, items: Iterable[dict[str, Any]]) -> list["Area"]:
+        """Create Area objects from a list of API response items."""
+        from_api = cls.from_api
+        return [from_api(item) for item in items]
     
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Area":
@@ -106,21 +159,31 @@ class Area:
             id=str(area_id),
             name=data.get("name", f"Area {area_id}"),
             state=AreaState.from_api(state_str),
-            raw_data=data,
+            raw_data=_raw(data),
         )
     
     @property
     def is_armed(self) -> bool:
         """Check if area is armed (any mode)."""
-        return self.state in (AreaState.ARMED, AreaState.STAY_ARMED)
+        return self.state in _ARMED_STATES
     
     @property
     def is_arming(self) -> bool:
         """Check if area is in the process of arming."""
-        return self.state in (AreaState.ARM_IN_PROGRESS, AreaState.STAY_ARM_IN_PROGRESS)
+        return self.state in _ARMING_STATES
 
 
-@dataclass
+# Output state parsers keyed by exact JSON type; one dict hit replaces an
+# isinstance chain, and type(True) is bool so bools never reach the int parser.
+_OUTPUT_ON_STATES = frozenset({"on", "1", "true", "active", "activated"})
+_OUTPUT_STATE_PARSERS: dict[type, Callable[[Any], bool]] = {
+    bool: lambda value: value,
+    int: lambda value: value == 1,
+    str: lambda value: value.lower() in _OUTPUT_ON_STATES,
+}
+
+
+@dataclass(slots=True)
 class Output:
     """Represents a controllable output."""
     
@@ -128,7 +191,13 @@ class Output:
     name: str
     state: bool = False
     output_type: str | None = None
-    raw_data: dict[str, Any] = field(default_factory=dict)
+    raw_data: Mapping[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_api_many(cls, items: Iterable[dict[str, Any]]) -> list["Output"]:
+        """Create Output objects from a list of API response items."""
+        from_api = cls.from_api
+        return [from_api(item) for item in items]
     
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Output":
@@ -137,25 +206,39 @@ class Output:
         
         # Parse state from various formats
         state_val = data.get("state", data.get("status", False))
-        if isinstance(state_val, bool):
-            state = state_val
-        elif isinstance(state_val, int):
-            state = state_val == 1
-        elif isinstance(state_val, str):
-            state = state_val.lower() in ("on", "1", "true", "active", "activated")
-        else:
-            state = False
+        parser = _OUTPUT_STATE_PARSERS.get(type(state_val))
+        state = parser(state_val) if parser else False
             
         return cls(
             id=str(output_id),
             name=data.get("name", f"Output {output_id}"),
             state=state,
-            output_type=data.get("type", data.get("outputType")),
-            raw_data=data,
+            output_type=_intern(data.get("type", data.get("outputType"))),
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+# Alphabetic strings that float() still accepts
+_FLOAT_WORDS = frozenset({"nan", "inf", "infinity"})
+
+
+def _parse_number(text: str) -> float | str:
+    """
+    Convert a measurement string to float, or return it unchanged.
+    
+    Text starting with an ASCII letter (e.g. "unknown") is rejected with a
+    single string comparison instead of a raised ValueError; everything else,
+    including the common plain decimals, goes straight to float().
+    """
+    if "9" < text < "\x80" and text.strip().lower() not in _FLOAT_WORDS:
+        return text
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+@dataclass(slots=True)
 class Measurement:
     """Represents a sensor measurement (temperature, humidity, etc.)."""
     
@@ -165,35 +248,54 @@ class Measurement:
     unit: str | None = None
     measurement_type: str | None = None
     zone_id: str | None = None
-    raw_data: dict[str, Any] = field(default_factory=dict)
+    raw_data: Mapping[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_api_many(cls, items: Iterable[dict[str, Any]]) -> list["Measurement"]:
+        """Create Measurement objects from a list of API response items."""
+        from_api = cls.from_api
+        return [from_api(item) for item in items]
     
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Measurement":
         """Create Measurement from API response data."""
         measurement_id = data.get("id") or data.get("_id", {}).get("device_id") or str(data.get("measurement_id", ""))
         
-        # Try to convert value to number
+        # Try to convert value to number; numeric JSON values need no parsing
         raw_value = data.get("value", data.get("currentValue"))
-        if raw_value is not None:
+        value: float | int | str | None
+        if raw_value is None or type(raw_value) is float:
+            value = raw_value
+        elif isinstance(raw_value, int):
+            value = float(raw_value)
+        elif isinstance(raw_value, str):
+            value = _parse_number(raw_value)
+        else:
             try:
-                value: float | int | str | None = float(raw_value)
+                value = float(raw_value)
             except (ValueError, TypeError):
                 value = str(raw_value)
-        else:
-            value = None
             
         return cls(
             id=str(measurement_id),
             name=data.get("name", f"Measurement {measurement_id}"),
             value=value,
-            unit=data.get("unit"),
-            measurement_type=data.get("type"),
+            unit=_intern(data.get("unit")),
+            measurement_type=_intern(data.get("type")),
             zone_id=data.get("zoneId", data.get("zone_id")),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+# Fallback timestamp formats for Event, with the input length each consumes
+_EVENT_TIME_FORMATS = (
+    ("%Y-%m-%dT%H:%M:%S", 19),
+    ("%Y-%m-%d %H:%M:%S", 19),
+    ("%Y-%m-%d", 10),
+)
+
+
+@dataclass(slots=True)
 class Event:
     """Represents an alarm event."""
     
@@ -204,7 +306,13 @@ class Event:
     zone_id: str | None = None
     zone_name: str | None = None
     user_id: str | None = None
-    raw_data: dict[str, Any] = field(default_factory=dict)
+    raw_data: Mapping[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_api_many(cls, items: Iterable[dict[str, Any]]) -> list["Event"]:
+        """Create Event objects from a list of API response items."""
+        from_api = cls.from_api
+        return [from_api(item) for item in items]
     
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> "Event":
@@ -218,12 +326,21 @@ class Event:
             if isinstance(ts_raw, (int, float)):
                 timestamp = datetime.fromtimestamp(ts_raw)
             elif isinstance(ts_raw, str):
-                for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
-                    try:
-                        timestamp = datetime.strptime(ts_raw[:len(fmt.replace("%", ""))], fmt)
-                        break
-                    except ValueError:
-                        continue
+                # The API sends ISO 8601, which fromisoformat parses in C.
+                # Timestamps are naive wall-clock times as sent, whatever the
+                # Python version: 3.10 rejects a "Z" suffix that 3.11+ accepts,
+                # so it is dropped up front, and any offset is dropped after.
+                try:
+                    timestamp = datetime.fromisoformat(
+                        ts_raw[:-1] if ts_raw.endswith("Z") else ts_raw
+                    ).replace(tzinfo=None)
+                except ValueError:
+                    for fmt, length in _EVENT_TIME_FORMATS:
+                        try:
+                            timestamp = datetime.strptime(ts_raw[:length], fmt)
+                            break
+                        except ValueError:
+                            continue
         
         return cls(
             id=str(event_id),
@@ -233,13 +350,35 @@ class Event:
             zone_id=data.get("zoneId", data.get("zone_id")),
             zone_name=data.get("zoneName", data.get("zone_name")),
             user_id=data.get("userId", data.get("user_id", data.get("user"))),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
 
+class _NullClient:
+    """Client stand-in for unconnected panels; every public method raises."""
+    
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        # Private and dunder lookups (copy, pickle and other protocol hooks)
+        # must fail normally rather than return a coroutine function
+        if name.startswith("_"):
+            raise AttributeError(name)
+        
+        async def _not_connected(*args: Any, **kwargs: Any) -> Any:
+            raise RuntimeError("Panel not connected to client")
+        return _not_connected
+
+
+_NULL_CLIENT = _NullClient()
+
+
 @dataclass
 class Panel:
-    """Represents a Crow alarm panel."""
+    """
+    Represents a Crow alarm panel.
+    
+    Unconnected panels get a stand-in client that raises RuntimeError, so no
+    method needs a connection guard.
+    """
     
     mac: str
     name: str
@@ -262,52 +401,41 @@ class Panel:
             _client=client,
         )
     
+    def __post_init__(self) -> None:
+        """Use the stand-in client when not connected."""
+        if self._client is None:
+            self._client = _NULL_CLIENT
+    
     async def get_areas(self) -> list[Area]:
         """Get all areas/partitions for this panel."""
-        if not self._client:
-            raise RuntimeError("Panel not connected to client")
         return await self._client.get_areas(self.mac)
     
     async def get_area(self, area_id: str) -> Area | None:
         """Get a specific area by ID."""
-        if not self._client:
-            raise RuntimeError("Panel not connected to client")
         return await self._client.get_area(self.mac, area_id)
     
     async def set_area_state(self, area_id: str, command: str | AreaCommand) -> Area | None:
         """Set the arm state of an area."""
-        if not self._client:
-            raise RuntimeError("Panel not connected to client")
         if isinstance(command, AreaCommand):
             command = command.value
         return await self._client.set_area_state(self.mac, area_id, command)
     
     async def get_zones(self) -> list[Zone]:
         """Get all zones for this panel."""
-        if not self._client:
-            raise RuntimeError("Panel not connected to client")
         return await self._client.get_zones(self.mac)
     
     async def get_outputs(self) -> list[Output]:
         """Get all outputs for this panel."""
-        if not self._client:
-            raise RuntimeError("Panel not connected to client")
         return await self._client.get_outputs(self.mac)
     
     async def set_output_state(self, output_id: str, state: bool) -> bool:
         """Set the state of an output."""
-        if not self._client:
-            raise RuntimeError("Panel not connected to client")
         return await self._client.set_output_state(self.mac, output_id, state)
     
     async def get_measurements(self) -> list[Measurement]:
         """Get all measurements for this panel."""
-        if not self._client:
-            raise RuntimeError("Panel not connected to client")
         return await self._client.get_measurements(self.mac)
     
     async def capture_cam_image(self, zone_id: str) -> bytes | None:
         """Capture an image from a camera zone."""
-        if not self._client:
-            raise RuntimeError("Panel not connected to client")
         return await self._client.capture_cam_image(self.mac, zone_id)
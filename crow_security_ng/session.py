@@ -6,6 +6,7 @@ but uses the improved CrowClient under the hood.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Callable
 
@@ -40,7 +41,9 @@ class Session:
         self._email = email
         self._password = password
         self._client: CrowClient | None = None
-        self._panels: dict[str, Panel] = {}
+        # Panel lookups are cached as futures rather than results, so
+        # concurrent callers for the same MAC share one API request.
+        self._panels: dict[str, asyncio.Future[Panel]] = {}
     
     def _get_client(self) -> CrowClient:
         """Get or create the underlying client."""
@@ -65,17 +68,21 @@ class Session:
         """
         normalized_mac = normalize_mac(mac)
         
-        # Check cache
-        if normalized_mac in self._panels:
-            return self._panels[normalized_mac]
+        # Check cache, including lookups still in flight
+        future = self._panels.get(normalized_mac)
+        if future is None:
+            client = self._get_client()
+            future = asyncio.ensure_future(client.get_panel(normalized_mac))
+            self._panels[normalized_mac] = future
         
-        client = self._get_client()
-        panel = await client.get_panel(normalized_mac)
-        
-        # Cache the panel
-        self._panels[normalized_mac] = panel
-        
-        return panel
+        try:
+            # Shielded so a cancelled caller doesn't cancel the shared lookup
+            return await asyncio.shield(future)
+        except Exception:
+            # Drop the failed lookup so a later call retries
+            if self._panels.get(normalized_mac) is future:
+                del self._panels[normalized_mac]
+            raise
     
     async def get_panels(self) -> list[Panel]:
         """
@@ -88,8 +95,11 @@ class Session:
         panels = await client.get_panels()
         
         # Cache all panels
+        loop = asyncio.get_running_loop()
         for panel in panels:
-            self._panels[panel.mac] = panel
+            future: asyncio.Future[Panel] = loop.create_future()
+            future.set_result(panel)
+            self._panels[panel.mac] = future
         
         return panels
     
@@ -130,6 +140,8 @@ class Session:
         if self._client:
             await self._client.close()
             self._client = None
+        for future in self._panels.values():
+            future.cancel()
         self._panels.clear()
     
     async def __aenter__(self) -> "Session":
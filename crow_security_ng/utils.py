@@ -1,14 +1,61 @@
 """Utility functions for the Crow Security NG library."""
 from __future__ import annotations
 
-import re
+from functools import lru_cache
+
 from .exceptions import InvalidMacError
 
+# Built once at import: deletes separators and whitespace and lowercases
+# A-F in the same C-level pass, so no separate .lower() call is needed
+_MAC_STRIP = str.maketrans(
+    "ABCDEF", "abcdef", ":-. \t\n\r\v\f"
+)
+_MAC_STRIP_BYTES = bytes.maketrans(b"ABCDEF", b"abcdef")
+_MAC_DELETE_BYTES = b":-. \t\n\r\v\f"
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _strip(mac: str | bytes | bytearray) -> str:
+    """Remove separators and whitespace from a MAC address and lowercase it."""
+    if isinstance(mac, str):
+        return mac.translate(_MAC_STRIP)
+    # Strip the raw bytes before decoding, so only the short result is
+    # decoded; latin-1 never fails and any non-hex byte is rejected later
+    return mac.translate(_MAC_STRIP_BYTES, _MAC_DELETE_BYTES).decode("latin-1")
+
+
+def _invalid(mac: str | bytes | bytearray) -> InvalidMacError:
+    """Build the error for an invalid MAC, reporting bytes input as text."""
+    if not isinstance(mac, str):
+        mac = mac.decode("ascii", "backslashreplace")
+    return InvalidMacError(mac)
+
+
+def _is_12hex(value: str) -> bool:
+    """Check that a stripped MAC is exactly 12 lowercase hex digits."""
+    # Both checks run in C; a set lookup per character beats the regex engine
+    return len(value) == 12 and _HEX_DIGITS.issuperset(value)
+
 
-def normalize_mac(mac: str) -> str:
+def _display(stripped: str, separator: str) -> str:
+    """Format a validated, stripped MAC as uppercase pairs, keeping the separator as is."""
+    if len(separator) == 1 and separator.isascii() and not separator.islower():
+        # bytes.hex() inserts the separator in C, with no per-pair slices;
+        # uppercasing the result leaves a separator like this unchanged
+        return bytes.fromhex(stripped).hex(separator).upper()
+    # bytes.hex() only takes a single ASCII character (or none at all), and
+    # uppercasing its result would also uppercase a letter separator
+    upper = stripped.upper()
+    pairs = [upper[i:i+2] for i in range(0, 12, 2)]
+    return separator.join(pairs)
+
+
+def normalize_mac(mac: str | bytes | bytearray) -> str:
     """
     Normalize a MAC address to lowercase without separators.
     
+    The address may be given as ``str`` or as ASCII ``bytes``/``bytearray``.
+    
     Accepts formats like:
     - AA:BB:CC:DD:EE:FF
     - AA-BB-CC-DD-EE-FF
@@ -18,49 +65,79 @@ def normalize_mac(mac: str) -> str:
     
     Returns: aabbccddeeff (lowercase, no separators)
     
+    Results are cached, as callers pass the same few MACs over and over.
+    
     Raises:
         InvalidMacError: If the MAC address is invalid.
     """
-    # Remove all common separators and whitespace
-    normalized = re.sub(r'[:\-\s.]', '', mac)
-    # Convert to lowercase
-    normalized = normalized.lower()
-    
-    # Validate
-    if not re.match(r'^[0-9a-f]{12}$', normalized):
-        raise InvalidMacError(mac)
-    
-    return normalized
+    if isinstance(mac, bytearray):
+        mac = bytes(mac)  # The cache needs a hashable key
+    return _normalize_mac(mac)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_mac(mac: str | bytes) -> str:
+    """Normalize a hashable MAC address; invalid ones raise and are not cached."""
+    stripped = _strip(mac)
+    if not _is_12hex(stripped):
+        raise _invalid(mac)
+    return stripped
 
 
-def format_mac(mac: str, separator: str = ":") -> str:
+def format_mac(mac: str | bytes | bytearray, separator: str = ":") -> str:
     """
     Format a MAC address with separators.
     
     Args:
-        mac: The MAC address to format (any format accepted).
+        mac: The MAC address to format (any format, as str or bytes).
         separator: The separator to use (default: ':').
         
     Returns:
         Formatted MAC address (e.g., 'AA:BB:CC:DD:EE:FF').
+        
+    Raises:
+        InvalidMacError: If the MAC address is invalid.
+    """
+    stripped = _strip(mac)
+    if not _is_12hex(stripped):
+        raise _invalid(mac)
+    return _display(stripped, separator)
+
+
+def canonicalize_mac(mac: str | bytes | bytearray, separator: str = ":") -> tuple[str, str]:
+    """
+    Normalize and format a MAC address in one go.
+    
+    Equivalent to ``(normalize_mac(mac), format_mac(mac, separator))``
+    but strips and validates the input only once.
+    
+    Args:
+        mac: The MAC address (any format, as str or bytes).
+        separator: The separator for the display form (default: ':').
+        
+    Returns:
+        A tuple of the normalized and formatted MAC address
+        (e.g., ('aabbccddeeff', 'AA:BB:CC:DD:EE:FF')).
+        
+    Raises:
+        InvalidMacError: If the MAC address is invalid.
     """
-    normalized = normalize_mac(mac)
-    pairs = [normalized[i:i+2] for i in range(0, 12, 2)]
-    return separator.join(pairs).upper()
+    stripped = _strip(mac)
+    if not _is_12hex(stripped):
+        raise _invalid(mac)
+    return stripped, _display(stripped, separator)
 
 
-def is_valid_mac(mac: str) -> bool:
+def is_valid_mac(mac: str | bytes | bytearray) -> bool:
     """
     Check if a MAC address is valid.
     
     Args:
-        mac: The MAC address to validate.
+        mac: The MAC address to validate, as str or bytes.
         
     Returns:
         True if valid, False otherwise.
     """
-    try:
-        normalize_mac(mac)
-        return True
-    except InvalidMacError:
-        return False
+    # Checked directly; raising and catching InvalidMacError is far slower
+    return _is_12hex(_strip(mac))
+
@@ -0,0 +1,252 @@
+"""Tests for the Crow Security client."""
+import asyncio
+import time
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from crow_security_ng import client as client_module
+from crow_security_ng.client import (
+    CrowSecurityClient,
+    close_shared_session,
+    get_shared_session,
+)
+from crow_security_ng.exceptions import CrowSecurityConnectionError, CrowSecurityError
+
+
+def make_client(**kwargs):
+    """Create a client with test credentials."""
+    return CrowSecurityClient("user@example.com", "secret", "AA:BB:CC:DD:EE:FF", **kwargs)
+
+
+class TestSharedSession:
+    """Tests for the per-loop shared session."""
+    
+    async def test_clients_share_one_session(self):
+        """Test that clients without a session share one, closed with the last client."""
+        first, second = make_client(), make_client()
+        session = first._get_session()
+        assert second._get_session() is session
+        await first.close()
+        assert not session.closed
+        await second.close()
+        assert session.closed
+    
+    async def test_caller_session_is_never_closed(self):
+        """Test that a caller-provided session stays open."""
+        async with aiohttp.ClientSession() as session:
+            client = make_client(session=session)
+            assert client._get_session() is session
+            await client.close()
+            assert not session.closed
+    
+    async def test_fetched_session_outlives_clients(self):
+        """Test that get_shared_session() pins the session until close_shared_session()."""
+        session = get_shared_session()
+        client = make_client()
+        assert client._get_session() is session
+        await client.close()
+        assert not session.closed
+        await close_shared_session()
+        assert session.closed
+    
+    async def test_injected_session_is_not_closed(self):
+        """Test that a host-injected session is forgotten but left open."""
+        async with aiohttp.ClientSession() as session:
+            CrowSecurityClient.configure_shared_session(session)
+            client = make_client()
+            assert client._get_session() is session
+            await client.close()
+            await close_shared_session()
+            assert not session.closed
+            assert make_client()._get_session() is not session
+            await close_shared_session()
+    
+    async def test_configure_rejects_replacing_open_session(self):
+        """Test that an open shared session cannot be silently replaced."""
+        get_shared_session()
+        with pytest.raises(RuntimeError):
+            CrowSecurityClient.configure_shared_session()
+        await close_shared_session()
+    
+    def test_new_loop_gets_new_session(self):
+        """Test that a session bound to a finished loop is not handed out again."""
+        client = make_client()
+        first = asyncio.run(self._session_of(client))
+        second = asyncio.run(self._session_of(client, close=True))
+        assert first is not second
+        assert first.closed is False  # Left to its own, finished loop
+        assert not client_module._SHARED_SESSIONS
+        asyncio.run(first.close())  # Never connected, so safe to close anywhere
+    
+    @staticmethod
+    async def _session_of(client, close=False):
+        session = client._get_session()
+        if close:
+            await client.close()
+        return session
+
+
+LOGIN_URL = "https://api.crowcloud.xyz/v1/login"
+SYSTEMS_URL = "https://api.crowcloud.xyz/v1/systems"
+
+
+@pytest.fixture
+async def client():
+    """Client that retries without waiting."""
+    crow = make_client(retry_delay=0)
+    yield crow
+    await crow.close()
+
+
+@pytest.fixture
+def mock_api():
+    """Mocked Crow Cloud API."""
+    with aioresponses() as mocked:
+        yield mocked
+
+
+def calls(mock_api, method, url):
+    """Requests the mocked API received for a method and URL."""
+    return mock_api.requests.get((method, URL(url)), [])
+
+
+class TestRequest:
+    """Tests for authenticated requests, retries and caching."""
+    
+    async def test_retries_then_succeeds(self, client, mock_api):
+        """Test that transient errors are retried."""
+        mock_api.post(LOGIN_URL, payload={"token": "abc"})
+        mock_api.get(SYSTEMS_URL, status=503)
+        mock_api.get(SYSTEMS_URL, exception=aiohttp.ClientConnectionError())
+        mock_api.get(SYSTEMS_URL, payload=[{"id": 1}])
+        assert await client.get_systems() == [{"id": 1}]
+        assert len(calls(mock_api, "GET", SYSTEMS_URL)) == 3
+    
+    async def test_gives_up_after_retry_count(self, client, mock_api):
+        """Test that retries stop after retry_count attempts."""
+        mock_api.post(LOGIN_URL, payload={"token": "abc"})
+        mock_api.get(SYSTEMS_URL, status=503, repeat=True)
+        with pytest.raises(CrowSecurityError):
+            await client.get_systems()
+        assert len(calls(mock_api, "GET", SYSTEMS_URL)) == client._retry_count + 1
+    
+    async def test_connection_errors_give_up(self, client, mock_api):
+        """Test that persistent connection errors raise a connection error."""
+        mock_api.post(LOGIN_URL, payload={"token": "abc"})
+        mock_api.get(SYSTEMS_URL, exception=aiohttp.ClientConnectionError(), repeat=True)
+        with pytest.raises(CrowSecurityConnectionError) as excinfo:
+            await client.get_systems()
+        assert isinstance(excinfo.value.__cause__, aiohttp.ClientConnectionError)
+    
+    async def test_retry_after_is_honored_and_capped(self, mock_api, monkeypatch):
+        """Test that Retry-After sets the wait, bounded by max_delay."""
+        delays = []
+        
+        async def fake_sleep(delay):
+            delays.append(delay)
+        
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        crow = make_client(retry_delay=1, max_delay=10)
+        mock_api.post(LOGIN_URL, payload={"token": "abc"})
+        mock_api.get(SYSTEMS_URL, status=429, headers={"Retry-After": "5"})
+        mock_api.get(SYSTEMS_URL, status=503, headers={"Retry-After": "120"})
+        mock_api.get(SYSTEMS_URL, payload=[])
+        assert await crow.get_systems() == []
+        assert delays == [5, 10]
+        await crow.close()
+    
+    def test_backoff_delay_is_jittered_and_bounded(self):
+        """Test that backoff doubles per attempt within +/-50% jitter, up to max_delay."""
+        crow = make_client(retry_delay=1, max_delay=10)
+        for attempt in range(6):
+            base = min(2 ** attempt, 10)
+            for _ in range(50):
+                assert 0.5 * base <= crow._backoff_delay(attempt) <= 1.5 * base
+    
+    async def test_401_logs_in_again_once(self, client, mock_api):
+        """Test that a 401 triggers exactly one re-login before retrying."""
+        mock_api.post(LOGIN_URL, payload={"token": "old"})
+        mock_api.post(LOGIN_URL, payload={"token": "new"})
+        mock_api.get(SYSTEMS_URL, status=401)
+        mock_api.get(SYSTEMS_URL, payload=[{"id": 1}])
+        assert await client.get_systems() == [{"id": 1}]
+        assert len(calls(mock_api, "POST", LOGIN_URL)) == 2
+        retried = calls(mock_api, "GET", SYSTEMS_URL)[1]
+        assert retried.kwargs["headers"]["Authorization"] == "Bearer new"
+    
+    async def test_concurrent_callers_share_one_login(self, client, mock_api):
+        """Test that concurrent requests without a token send a single login."""
+        mock_api.post(LOGIN_URL, payload={"token": "abc"}, repeat=True)
+        mock_api.get(SYSTEMS_URL, payload=[], repeat=True)
+        await asyncio.gather(*(client.get_systems() for _ in range(5)))
+        assert len(calls(mock_api, "POST", LOGIN_URL)) == 1
+    
+    async def test_stale_token_refreshes_in_background(self, client, mock_api):
+        """Test that a stale token is used while a refresh runs in the background."""
+        client._token = "stale"
+        client._token_lifetime = 100.0
+        client._token_expiry = time.monotonic() + 1  # Inside the stale window
+        mock_api.post(LOGIN_URL, payload={"token": "fresh"})
+        mock_api.get(SYSTEMS_URL, payload=[])
+        await client.get_systems()
+        request = calls(mock_api, "GET", SYSTEMS_URL)[0]
+        assert request.kwargs["headers"]["Authorization"] == "Bearer stale"
+        assert client._refresh_task is not None
+        await client._refresh_task
+        assert client._token == "fresh"
+        assert client._token_is_fresh()
+    
+    async def test_304_returns_cached_payload(self, client, mock_api):
+        """Test that a 304 answers with the payload of the cached response."""
+        mock_api.post(LOGIN_URL, payload={"token": "abc"})
+        mock_api.get(SYSTEMS_URL, payload=[{"id": 1}], headers={"ETag": '"v1"'})
+        mock_api.get(SYSTEMS_URL, status=304)
+        assert await client.get_systems() == [{"id": 1}]
+        assert await client.get_systems() == [{"id": 1}]
+        revalidated = calls(mock_api, "GET", SYSTEMS_URL)[1]
+        assert revalidated.kwargs["headers"]["If-None-Match"] == '"v1"'
+    
+    async def test_cached_payload_is_a_copy(self, client, mock_api):
+        """Test that mutating a result does not change later cached results."""
+        mock_api.post(LOGIN_URL, payload={"token": "abc"})
+        mock_api.get(SYSTEMS_URL, payload=[{"id": 1}], headers={"ETag": '"v1"'})
+        mock_api.get(SYSTEMS_URL, status=304)
+        first = await client.get_systems()
+        first.append({"id": 2})
+        assert await client.get_systems() == [{"id": 1}]
+    
+    async def test_cache_is_keyed_on_params(self, client, mock_api):
+        """Test that requests with different params are cached separately."""
+        mock_api.post(LOGIN_URL, payload={"token": "abc"})
+        mock_api.get(SYSTEMS_URL + "?page=1", payload=[1], headers={"ETag": '"p1"'})
+        mock_api.get(SYSTEMS_URL + "?page=2", payload=[2])
+        await client._request("GET", SYSTEMS_URL, params={"page": 1})
+        await client._request("GET", SYSTEMS_URL, params={"page": 2})
+        second = calls(mock_api, "GET", SYSTEMS_URL + "?page=2")[0]
+        assert "If-None-Match" not in second.kwargs["headers"]
+    
+    async def test_response_without_etag_is_not_cached(self, client, mock_api):
+        """Test that only responses with an ETag are kept for revalidation."""
+        mock_api.post(LOGIN_URL, payload={"token": "abc"})
+        mock_api.get(SYSTEMS_URL, payload=[{"id": 1}])
+        await client.get_systems()
+        assert not client._response_cache
+    
+    async def test_cache_is_bounded_and_cleared_on_close(self, client, mock_api, monkeypatch):
+        """Test that old responses are evicted and close() drops the rest."""
+        monkeypatch.setattr(client_module, "RESPONSE_CACHE_SIZE", 2)
+        mock_api.post(LOGIN_URL, payload={"token": "abc"})
+        for page in range(3):
+            mock_api.get(
+                f"{SYSTEMS_URL}?page={page}", payload=[page], headers={"ETag": f'"p{page}"'}
+            )
+            await client._request("GET", SYSTEMS_URL, params={"page": page})
+        assert [key[1] for key in client._response_cache] == [
+            (("page", 1),),
+            (("page", 2),),
+        ]
+        await client.close()
+        assert not client._response_cache
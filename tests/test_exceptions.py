@@ -66,6 +66,11 @@ class TestResponseError:
         long_text = "x" * 500
         err = ResponseError(400, "Bad request", long_text)
         assert len(str(err)) < 500  # Should be truncated
+    
+    def test_attributes_stored_in_slots(self):
+        """Test that attributes don't populate the instance __dict__."""
+        err = ResponseError(400, "Bad request", "Invalid JSON")
+        assert err.__dict__ == {}
 
 
 class TestPanelNotFoundError:
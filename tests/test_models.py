@@ -1,11 +1,19 @@
 """Tests for data models."""
+import copy
+import dataclasses
+from datetime import datetime
+
 import pytest
 
+from crow_security_ng import models
 from crow_security_ng.models import (
     Area,
+    AreaCommand,
     AreaState,
+    Event,
     Measurement,
     Output,
+    Panel,
     Zone,
 )
 
@@ -27,6 +35,11 @@ class TestAreaState:
         """Test parsing stay armed state."""
         assert AreaState.from_api("stay_armed") == AreaState.STAY_ARMED
     
+    def test_from_api_in_progress(self):
+        """Test parsing arming-in-progress states."""
+        assert AreaState.from_api("Arm In Progress") == AreaState.ARM_IN_PROGRESS
+        assert AreaState.from_api("stay arm in progress") == AreaState.STAY_ARM_IN_PROGRESS
+    
     def test_from_api_unknown(self):
         """Test parsing unknown state defaults to disarmed."""
         assert AreaState.from_api("unknown") == AreaState.DISARMED
@@ -87,6 +100,27 @@ class TestZone:
         assert zone_low.has_low_battery is True
         assert zone_ok.has_low_battery is False
         assert zone_none.has_low_battery is False
+    
+    def test_raw_data_opt_in(self, monkeypatch):
+        """Test that raw API data is only kept when enabled."""
+        data = {"id": "1", "name": "Test"}
+        monkeypatch.setattr(models, "_KEEP_RAW", False)
+        assert Zone.from_api(data).raw_data == {}
+        monkeypatch.setattr(models, "_KEEP_RAW", True)
+        assert Zone.from_api(data).raw_data is data
+        
+        with_envelope = {**data, "_links": {"self": "/zones/1"}}
+        assert Zone.from_api(with_envelope).raw_data == data
+    
+    def test_from_api_many(self):
+        """Test creating zones from a list of API items."""
+        zones = Zone.from_api_many([
+            {"id": "1", "name": "Door"},
+            {"id": "2", "name": "Window", "state": "open"},
+        ])
+        
+        assert [zone.id for zone in zones] == ["1", "2"]
+        assert zones[1].is_open is True
 
 
 class TestArea:
@@ -196,3 +230,110 @@ class TestMeasurement:
         # None
         m4 = Measurement.from_api({"id": "4", "name": "Test"})
         assert m4.value is None
+    
+    def test_value_conversion_string_shapes(self):
+        """Test less common numeric and non-numeric strings."""
+        assert Measurement.from_api({"id": "1", "value": "-3.5"}).value == -3.5
+        assert Measurement.from_api({"id": "1", "value": "1e3"}).value == 1000.0
+        assert Measurement.from_api({"id": "1", "value": " 7 "}).value == 7.0
+        assert Measurement.from_api({"id": "1", "value": "n/a"}).value == "n/a"
+        assert Measurement.from_api({"id": "1", "value": "1.2.3"}).value == "1.2.3"
+
+
+class TestEvent:
+    """Tests for Event model."""
+    
+    def test_from_api_basic(self):
+        """Test creating event from basic API data."""
+        data = {
+            "id": "ev1",
+            "type": "alarm",
+            "description": "Front door opened",
+            "timestamp": "2024-03-01T12:30:45",
+            "zoneId": "1",
+        }
+        event = Event.from_api(data)
+        
+        assert event.id == "ev1"
+        assert event.event_type == "alarm"
+        assert event.description == "Front door opened"
+        assert event.timestamp == datetime(2024, 3, 1, 12, 30, 45)
+        assert event.zone_id == "1"
+    
+    def test_timestamp_formats(self):
+        """Test parsing various timestamp formats."""
+        expected = datetime(2024, 3, 1, 12, 30, 45)
+        assert Event.from_api({"time": "2024-03-01 12:30:45"}).timestamp == expected
+        assert Event.from_api({"time": "2024-03-01T12:30:45.123"}).timestamp.replace(microsecond=0) == expected
+        assert Event.from_api({"date": "2024-03-01"}).timestamp == datetime(2024, 3, 1)
+        assert Event.from_api({"time": "2024/03/01"}).timestamp is None
+        assert Event.from_api({"time": "2024-03-01T12:30:45Z"}).timestamp == expected
+        assert Event.from_api({"time": "2024-03-01T12:30:45+02:00"}).timestamp == expected
+        assert Event.from_api({"time": "2024-03-01T12:30:45.000Z"}).timestamp == expected
+        assert Event.from_api({}).timestamp is None
+    
+    def test_epoch_timestamp(self):
+        """Test parsing a numeric epoch timestamp."""
+        event = Event.from_api({"timestamp": 0})
+        assert event.timestamp is None  # 0 is treated as missing
+        event = Event.from_api({"timestamp": 1709296245})
+        assert event.timestamp == datetime.fromtimestamp(1709296245)
+
+
+class TestPanel:
+    """Tests for Panel model."""
+    
+    class FakeClient:
+        """Client stub with only the panel methods these tests use."""
+        
+        def __init__(self, prefix="Zone on"):
+            self.prefix = prefix
+        
+        async def get_zones(self, mac):
+            return [Zone(id="1", name=f"{self.prefix} {mac}")]
+        
+        async def set_output_state(self, mac, output_id, state):
+            return state
+        
+        async def set_area_state(self, mac, area_id, command):
+            return command
+    
+    async def test_forwards_to_client(self):
+        """Test that panel methods call the client with the panel MAC."""
+        panel = Panel.from_api({"name": "Home"}, "aabbccddeeff", self.FakeClient())
+        
+        zones = await panel.get_zones()
+        assert zones[0].name == "Zone on aabbccddeeff"
+        assert await panel.set_output_state("1", True) is True
+        assert await panel.set_area_state("1", AreaCommand.STAY) == "stay"
+    
+    async def test_missing_client_method_fails_on_use(self):
+        """Test that a client lacking a method only fails when it is used."""
+        panel = Panel.from_api({"name": "Home"}, "aabbccddeeff", self.FakeClient())
+        
+        with pytest.raises(AttributeError):
+            await panel.get_outputs()
+    
+    async def test_follows_reassigned_client(self):
+        """Test that replacing the client is picked up by later calls."""
+        panel = Panel.from_api({"name": "Home"}, "aabbccddeeff", self.FakeClient())
+        panel._client = self.FakeClient(prefix="Moved to")
+        
+        zones = await panel.get_zones()
+        assert zones[0].name == "Moved to aabbccddeeff"
+    
+    async def test_not_connected(self):
+        """Test that an unconnected panel raises."""
+        panel = Panel(mac="aabbccddeeff", name="Home")
+        
+        with pytest.raises(RuntimeError):
+            await panel.get_zones()
+    
+    async def test_not_connected_copies_cleanly(self):
+        """Test that copying an unconnected panel doesn't call the stand-in client."""
+        panel = Panel(mac="aabbccddeeff", name="Home")
+        
+        clone = copy.deepcopy(panel)
+        assert dataclasses.asdict(panel)["mac"] == "aabbccddeeff"
+        with pytest.raises(RuntimeError):
+            await clone.get_zones()
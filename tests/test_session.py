@@ -0,0 +1,64 @@
+"""Tests for the backwards-compatible Session."""
+import asyncio
+import importlib
+import sys
+
+import pytest
+
+from crow_security_ng import client as client_module
+from crow_security_ng.exceptions import PanelNotFoundError
+from crow_security_ng.models import Panel
+
+
+class FakeClient:
+    """Client stand-in that counts panel lookups and can fail the first one."""
+    
+    fail_first = False
+    
+    def __init__(self, email, password):
+        self.lookups = 0
+    
+    async def get_panel(self, mac):
+        self.lookups += 1
+        await asyncio.sleep(0)
+        if self.fail_first and self.lookups == 1:
+            raise PanelNotFoundError(mac)
+        return Panel(mac=mac, name="Panel")
+    
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def session_module(monkeypatch):
+    """The session module, imported against the fake client."""
+    # session.py imports CrowClient, which the client module does not define
+    monkeypatch.setattr(client_module, "CrowClient", FakeClient, raising=False)
+    monkeypatch.delitem(sys.modules, "crow_security_ng.session", raising=False)
+    return importlib.import_module("crow_security_ng.session")
+
+
+class TestGetPanel:
+    """Tests for panel lookups."""
+    
+    async def test_concurrent_callers_share_one_lookup(self, session_module):
+        """Test that concurrent get_panel calls for one MAC make a single request."""
+        session = session_module.Session("user@example.com", "secret")
+        panels = await asyncio.gather(
+            session.get_panel("AA:BB:CC:DD:EE:FF"),
+            session.get_panel("aabbccddeeff"),
+        )
+        assert panels[0] is panels[1]
+        assert session._client.lookups == 1
+        await session.close()
+    
+    async def test_failed_lookup_is_retried(self, session_module, monkeypatch):
+        """Test that a failed lookup is not cached, so the next call retries."""
+        monkeypatch.setattr(FakeClient, "fail_first", True)
+        session = session_module.Session("user@example.com", "secret")
+        with pytest.raises(PanelNotFoundError):
+            await session.get_panel("AA:BB:CC:DD:EE:FF")
+        panel = await session.get_panel("AA:BB:CC:DD:EE:FF")
+        assert panel.name == "Panel"
+        assert session._client.lookups == 2
+        await session.close()
@@ -1,87 +1,127 @@
 """Tests for utility functions."""
 import pytest
 
+from crow_security_ng import utils
+from crow_security_ng.exceptions import InvalidMacError
 from crow_security_ng.utils import (
+    canonicalize_mac,
     format_mac,
     is_valid_mac,
     normalize_mac,
 )
-from crow_security_ng.exceptions import InvalidMacError
 
 
-class TestNormalizeMac:
-    """Tests for normalize_mac function."""
-    
-    def test_already_normalized(self):
-        """Test with already normalized MAC."""
-        assert normalize_mac("aabbccddeeff") == "aabbccddeeff"
-    
-    def test_uppercase(self):
-        """Test with uppercase MAC."""
-        assert normalize_mac("AABBCCDDEEFF") == "aabbccddeeff"
-    
-    def test_with_colons(self):
-        """Test with colon separators."""
-        assert normalize_mac("AA:BB:CC:DD:EE:FF") == "aabbccddeeff"
-    
-    def test_with_dashes(self):
-        """Test with dash separators."""
-        assert normalize_mac("AA-BB-CC-DD-EE-FF") == "aabbccddeeff"
-    
-    def test_with_spaces(self):
-        """Test with space separators."""
-        assert normalize_mac("AA BB CC DD EE FF") == "aabbccddeeff"
-    
-    def test_with_dots(self):
-        """Test with dot separators."""
-        assert normalize_mac("AABB.CCDD.EEFF") == "aabbccddeeff"
-    
-    def test_mixed_case(self):
-        """Test with mixed case."""
-        assert normalize_mac("aAbBcCdDeEfF") == "aabbccddeeff"
-    
-    def test_invalid_length(self):
-        """Test with invalid length."""
-        with pytest.raises(InvalidMacError):
-            normalize_mac("AABBCCDD")
-    
-    def test_invalid_characters(self):
-        """Test with invalid characters."""
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "aabbccddeeff",
+        "AABBCCDDEEFF",
+        "AA:BB:CC:DD:EE:FF",
+        "AA-BB-CC-DD-EE-FF",
+        "AA BB CC DD EE FF",
+        "AABB.CCDD.EEFF",
+        "aAbBcCdDeEfF",
+    ],
+)
+def test_normalize_mac_normalizes_to_canonical(raw):
+    """Test that every accepted format normalizes the same way."""
+    assert normalize_mac(raw) == "aabbccddeeff"
+
+
+@pytest.mark.parametrize("raw", ["AABBCCDD", "AABBCCDDEEGG", ""])
+def test_normalize_mac_invalid(raw):
+    """Test with invalid length, characters, or an empty string."""
+    with pytest.raises(InvalidMacError):
+        normalize_mac(raw)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"AA:BB:CC:DD:EE:FF",
+        b"aabbccddeeff",
+        b"AA-BB-CC-DD-EE-FF",
+        bytearray(b"AA:BB:CC:DD:EE:FF"),
+    ],
+)
+def test_normalize_mac_bytes_input(raw):
+    """Test that MACs given as bytes normalize to the same string."""
+    assert normalize_mac(raw) == "aabbccddeeff"
+
+
+@pytest.mark.parametrize("raw", [b"AABBCCDDEEGG", b"AABBCCDDEE\xc4F"])
+def test_normalize_mac_invalid_bytes(raw):
+    """Test that non-hex bytes are rejected, reported as text."""
+    with pytest.raises(InvalidMacError) as excinfo:
+        normalize_mac(raw)
+    assert isinstance(excinfo.value.mac, str)
+
+
+def test_normalize_mac_repeated_calls_are_cached():
+    """Test that repeated lookups of the same MAC hit the cache."""
+    normalize_mac("AA:BB:CC:DD:EE:01")
+    hits = utils._normalize_mac.cache_info().hits
+    assert normalize_mac("AA:BB:CC:DD:EE:01") == "aabbccddee01"
+    assert utils._normalize_mac.cache_info().hits == hits + 1
+
+
+def test_normalize_mac_invalid_mac_raises_every_time():
+    """Test that invalid MACs are not cached and keep raising."""
+    for _ in range(2):
         with pytest.raises(InvalidMacError):
             normalize_mac("AABBCCDDEEGG")
-    
-    def test_empty_string(self):
-        """Test with empty string."""
-        with pytest.raises(InvalidMacError):
-            normalize_mac("")
-
-
-class TestFormatMac:
-    """Tests for format_mac function."""
-    
-    def test_default_separator(self):
-        """Test with default colon separator."""
-        assert format_mac("aabbccddeeff") == "AA:BB:CC:DD:EE:FF"
-    
-    def test_dash_separator(self):
-        """Test with dash separator."""
-        assert format_mac("aabbccddeeff", "-") == "AA-BB-CC-DD-EE-FF"
-    
-    def test_already_formatted(self):
-        """Test with already formatted MAC."""
-        assert format_mac("AA:BB:CC:DD:EE:FF") == "AA:BB:CC:DD:EE:FF"
-
-
-class TestIsValidMac:
-    """Tests for is_valid_mac function."""
-    
-    def test_valid_mac(self):
-        """Test with valid MAC."""
-        assert is_valid_mac("AABBCCDDEEFF") is True
-        assert is_valid_mac("aa:bb:cc:dd:ee:ff") is True
-    
-    def test_invalid_mac(self):
-        """Test with invalid MAC."""
-        assert is_valid_mac("invalid") is False
-        assert is_valid_mac("AABBCCDDEE") is False
-        assert is_valid_mac("") is False
+
+
+@pytest.mark.parametrize(
+    ("raw", "separator", "expected"),
+    [
+        ("aabbccddeeff", ":", "AA:BB:CC:DD:EE:FF"),
+        ("aabbccddeeff", "-", "AA-BB-CC-DD-EE-FF"),
+        ("AA:BB:CC:DD:EE:FF", ":", "AA:BB:CC:DD:EE:FF"),
+        ("aabbccddeeff", ", ", "AA, BB, CC, DD, EE, FF"),
+        ("aabbccddeeff", "", "AABBCCDDEEFF"),
+        ("aabbccddeeff", "x", "AAxBBxCCxDDxEExFF"),
+        ("aabbccddeeff", "x.", "AAx.BBx.CCx.DDx.EEx.FF"),
+    ],
+)
+def test_format_mac_format(raw, separator, expected):
+    """Test formatting with single, multi-character and empty separators."""
+    assert format_mac(raw, separator) == expected
+
+
+def test_format_mac_default_separator():
+    """Test that the separator defaults to a colon."""
+    assert format_mac("aabbccddeeff") == "AA:BB:CC:DD:EE:FF"
+
+
+def test_canonicalize_mac_returns_both_forms():
+    """Test that the normalized and display forms come back together."""
+    assert canonicalize_mac("aa-bb-cc-dd-ee-ff") == (
+        "aabbccddeeff",
+        "AA:BB:CC:DD:EE:FF",
+    )
+    assert canonicalize_mac(b"AABBCCDDEEFF", "-") == (
+        "aabbccddeeff",
+        "AA-BB-CC-DD-EE-FF",
+    )
+
+
+def test_canonicalize_mac_invalid():
+    """Test with invalid MAC."""
+    with pytest.raises(InvalidMacError):
+        canonicalize_mac("AABBCCDDEEGG")
+
+
+@pytest.mark.parametrize(
+    "raw", ["AABBCCDDEEFF", "aa:bb:cc:dd:ee:ff", b"AA:BB:CC:DD:EE:FF"]
+)
+def test_is_valid_mac_valid(raw):
+    """Test with valid MAC."""
+    assert is_valid_mac(raw) is True
+
+
+@pytest.mark.parametrize("raw", ["invalid", "AABBCCDDEE", ""])
+def test_is_valid_mac_invalid(raw):
+    """Test with invalid MAC."""
+    assert is_valid_mac(raw) is False
+